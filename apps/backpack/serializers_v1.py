@@ -14,13 +14,13 @@ from issuer.helpers import BadgeCheckHelper
 from issuer.models import BadgeInstance
 from issuer.serializers_v1 import EvidenceItemSerializer
 from mainsite.drf_fields import Base64FileField
-from mainsite.serializers import StripTagsCharField, MarkdownCharField
+from mainsite.serializers import StripTagsCharField, MarkdownCharField, NestedSerializerCacheMixin
 from mainsite.utils import OriginSetting
 
 logger = badgrlog.BadgrLogger()
 
 
-class LocalBadgeInstanceUploadSerializerV1(serializers.Serializer):
+class LocalBadgeInstanceUploadSerializerV1(NestedSerializerCacheMixin, serializers.Serializer):
     image = Base64FileField(required=False, write_only=True)
     url = serializers.URLField(required=False, write_only=True)
     assertion = serializers.CharField(required=False, write_only=True)
@@ -55,7 +55,8 @@ class LocalBadgeInstanceUploadSerializerV1(serializers.Serializer):
         # if isinstance(obj, BadgeInstance):
 
         representation['id'] = obj.entity_id
-        representation['json'] = V1BadgeInstanceSerializer(obj, context=self.context).data
+        representation['json'] = self.get_nested_serializer(
+            V1BadgeInstanceSerializer, context=self.context).to_representation(obj)
         representation['imagePreview'] = {
             "type": "image",
             "id": "{}{}?type=png".format(OriginSetting.HTTP, reverse('badgeclass_image', kwargs={'entity_id': obj.cached_badgeclass.entity_id}))
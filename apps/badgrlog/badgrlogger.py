@@ -11,6 +11,9 @@ class BadgrLogger(object):
     def event(self, event):
         if not isinstance(event, BaseBadgrEvent):
             raise NotImplementedError()
+        if not self.logger.isEnabledFor(logging.INFO):
+            # compacted() serializes the event's objects, don't build it for a sink that will drop it
+            return
         obj = event.compacted()
         self.logger.info(obj)
 
@@ -1,7 +1,10 @@
 # encoding: utf-8
 
 
+from cachemodel.utils import generate_cache_key
+from django.core.cache import cache
 from django.core.exceptions import FieldError
+from django.db.models import prefetch_related_objects
 from django.http import Http404
 from rest_framework.exceptions import NotAuthenticated
 from rest_framework.response import Response
@@ -132,6 +135,18 @@ class VersionedObjectMixin(object):
         # nothing found
         raise Http404
 
+    def get_object_once(self, request, **kwargs):
+        """
+        get_object(), but reuse an object this view (i.e. this request) has already fetched and permission-checked
+        for the same kwargs, instead of going back to the cache for it.
+        """
+        resolved_objects = self.__dict__.setdefault('_resolved_objects', {})
+        key = tuple(sorted(kwargs.items()))
+        if key not in resolved_objects:
+            resolved_objects[key] = self.get_object(request, **kwargs)
+        self.object = resolved_objects[key]
+        return self.object
+
     def get_entity_id_field_name(self):
         return self.entity_id_field_name
 
@@ -180,6 +195,9 @@ class UncachedPaginatedViewMixin(object):
     default_per_page = None  # dont paginate by default
     per_page_query_parameter_name = 'num'
     ordering = "-created_at"
+    unpaginated_chunk_size = None  # load unpaginated results in a single query by default
+    # (cached_method name, prefetch lookup) pairs, see prefetch_cache_misses()
+    cache_miss_prefetches = ()
 
     def get_ordering(self):
         return self.ordering
@@ -197,6 +215,37 @@ class UncachedPaginatedViewMixin(object):
     def get_queryset(self, request, **kwargs):
         raise NotImplementedError
 
+    def prefetch_cache_misses(self, objects):
+        """
+        For each cache_miss_prefetches pair, prefetch the lookup onto only those objects whose cached_method result
+        is missing from the cache, so a cold cache costs one query per lookup instead of one per object and a warm
+        cache costs a get_many() and no queries.
+        """
+        for method_name, lookup in self.cache_miss_prefetches:
+            # the same key cachemodel's cached_method wrapper reads and writes
+            keyed_objects = {generate_cache_key([obj.__class__.__name__, method_name, obj.pk]): obj for obj in objects}
+            cached_keys = cache.get_many(list(keyed_objects.keys()))
+            misses = [obj for key, obj in keyed_objects.items() if key not in cached_keys]
+            if misses:
+                prefetch_related_objects(misses, lookup)
+        return objects
+
+    def iterate_in_chunks(self, queryset, chunk_size):
+        """
+        Yield every object in queryset, fetching chunk_size rows at a time in pk order so only one chunk of
+        model instances is held in memory. cache_miss_prefetches are applied per chunk.
+        """
+        queryset = queryset.order_by('pk')
+        last_pk = None
+        while True:
+            chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            chunk = self.prefetch_cache_misses(list(chunk_queryset[:chunk_size]))
+            for obj in chunk:
+                yield obj
+            if len(chunk) < chunk_size:
+                return
+            last_pk = chunk[-1].pk
+
     def get_objects(self, request, **kwargs):
         queryset = self.get_queryset(request=request, **kwargs)
         per_page = self.get_page_size(request)
@@ -204,8 +253,10 @@ class UncachedPaginatedViewMixin(object):
         # only paginate on request
         if per_page:
             self.paginator = BadgrCursorPagination(ordering=self.get_ordering(), page_size=per_page)
-            page = self.paginator.paginate_queryset(queryset, request=request)
+            page = self.prefetch_cache_misses(self.paginator.paginate_queryset(queryset, request=request))
+        elif self.unpaginated_chunk_size:
+            page = self.iterate_in_chunks(queryset, self.unpaginated_chunk_size)
         else:
-            page = list(queryset)
+            page = self.prefetch_cache_misses(list(queryset))
 
         return page
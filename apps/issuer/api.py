@@ -34,6 +34,19 @@ from mainsite.models import AccessTokenProxy
 
 logger = badgrlog.BadgrLogger()
 
+# cached methods walked by the badgeclass serializers, and the reverse relation to prefetch when they miss the cache
+BADGECLASS_LIST_CACHE_MISS_PREFETCHES = (
+    ('cached_tags', 'badgeclasstag_set'),
+    ('cached_alignments', 'badgeclassalignment_set'),
+    ('cached_extensions', 'badgeclassextension_set'),
+)
+
+# cached methods walked by the assertion serializers, and the reverse relation to prefetch when they miss the cache
+BADGEINSTANCE_LIST_CACHE_MISS_PREFETCHES = (
+    ('cached_evidence', 'badgeinstanceevidence_set'),
+    ('cached_extensions', 'badgeinstanceextension_set'),
+)
+
 
 class IssuerList(BaseEntityListView):
     """
@@ -115,6 +128,7 @@ class AllBadgeClassesList(UncachedPaginatedViewMixin, BaseEntityListView):
     v1_serializer_class = BadgeClassSerializerV1
     v2_serializer_class = BadgeClassSerializerV2
     valid_scopes = ["rw:issuer"]
+    cache_miss_prefetches = BADGECLASS_LIST_CACHE_MISS_PREFETCHES
 
     def get_queryset(self, request, **kwargs):
         if self.get_page_size(request) is None:
@@ -159,9 +173,10 @@ class IssuerBadgeClassList(UncachedPaginatedViewMixin, VersionedObjectMixin, Bas
     v2_serializer_class = BadgeClassSerializerV2
     create_event = badgrlog.BadgeClassCreatedEvent
     valid_scopes = ["rw:issuer", "rw:issuer:*"]
+    cache_miss_prefetches = BADGECLASS_LIST_CACHE_MISS_PREFETCHES
 
     def get_queryset(self, request=None, **kwargs):
-        issuer = self.get_object(request, **kwargs)
+        issuer = self.get_object_once(request, **kwargs)
 
         if self.get_page_size(request) is None:
             return issuer.cached_badgeclasses()
@@ -169,7 +184,7 @@ class IssuerBadgeClassList(UncachedPaginatedViewMixin, VersionedObjectMixin, Bas
 
     def get_context_data(self, **kwargs):
         context = super(IssuerBadgeClassList, self).get_context_data(**kwargs)
-        context['issuer'] = self.get_object(self.request, **kwargs)
+        context['issuer'] = self.get_object_once(self.request, **kwargs)
         return context
 
     @apispec_list_operation('BadgeClass',
@@ -194,7 +209,7 @@ class IssuerBadgeClassList(UncachedPaginatedViewMixin, VersionedObjectMixin, Bas
         tags=["Issuers", "BadgeClasses"],
     )
     def post(self, request, **kwargs):
-        issuer = self.get_object(request, **kwargs)  # trigger a has_object_permissions() check
+        issuer = self.get_object_once(request, **kwargs)  # trigger a has_object_permissions() check
         return super(IssuerBadgeClassList, self).post(request, **kwargs)
 
 
@@ -264,7 +279,7 @@ class BatchAssertionsIssue(VersionedObjectMixin, BaseEntityView):
 
     def get_context_data(self, **kwargs):
         context = super(BatchAssertionsIssue, self).get_context_data(**kwargs)
-        context['badgeclass'] = self.get_object(self.request, **kwargs)
+        context['badgeclass'] = self.get_object_once(self.request, **kwargs)
         return context
 
     @apispec_post_operation('Assertion',
@@ -284,7 +299,7 @@ class BatchAssertionsIssue(VersionedObjectMixin, BaseEntityView):
     )
     def post(self, request, **kwargs):
         # verify the user has permission to the badgeclass
-        badgeclass = self.get_object(request, **kwargs)
+        badgeclass = self.get_object_once(request, **kwargs)
         if not self.has_object_permissions(request, badgeclass):
             return Response(status=HTTP_404_NOT_FOUND)
 
@@ -294,10 +309,7 @@ class BatchAssertionsIssue(VersionedObjectMixin, BaseEntityView):
             return Response(status=HTTP_400_BAD_REQUEST)
 
         # update passed in assertions to include create_notification
-        def _include_create_notification(a):
-            a['create_notification'] = create_notification
-            return a
-        assertions = list(map(_include_create_notification, request.data.get('assertions')))
+        assertions = [dict(a, create_notification=create_notification) for a in request.data.get('assertions')]
 
         # save serializers
         context = self.get_context_data(**kwargs)
@@ -403,9 +415,10 @@ class BadgeInstanceList(UncachedPaginatedViewMixin, VersionedObjectMixin, BaseEn
     v2_serializer_class = BadgeInstanceSerializerV2
     create_event = badgrlog.BadgeInstanceCreatedEvent
     valid_scopes = ["rw:issuer", "rw:issuer:*"]
+    cache_miss_prefetches = BADGEINSTANCE_LIST_CACHE_MISS_PREFETCHES
 
     def get_queryset(self, request=None, **kwargs):
-        badgeclass = self.get_object(request, **kwargs)
+        badgeclass = self.get_object_once(request, **kwargs)
         queryset = BadgeInstance.objects.filter(
             badgeclass=badgeclass,
             revoked=False
@@ -418,7 +431,7 @@ class BadgeInstanceList(UncachedPaginatedViewMixin, VersionedObjectMixin, BaseEn
 
     def get_context_data(self, **kwargs):
         context = super(BadgeInstanceList, self).get_context_data(**kwargs)
-        context['badgeclass'] = self.get_object(self.request, **kwargs)
+        context['badgeclass'] = self.get_object_once(self.request, **kwargs)
         return context
 
     @apispec_list_operation('Assertion',
@@ -441,7 +454,7 @@ class BadgeInstanceList(UncachedPaginatedViewMixin, VersionedObjectMixin, BaseEn
     )
     def get(self, request, **kwargs):
         # verify the user has permission to the badgeclass
-        badgeclass = self.get_object(request, **kwargs)
+        self.get_object_once(request, **kwargs)
         return super(BadgeInstanceList, self).get(request, **kwargs)
 
     @apispec_post_operation('Assertion',
@@ -450,7 +463,7 @@ class BadgeInstanceList(UncachedPaginatedViewMixin, VersionedObjectMixin, BaseEn
     )
     def post(self, request, **kwargs):
         # verify the user has permission to the badgeclass
-        badgeclass = self.get_object(request, **kwargs)
+        self.get_object_once(request, **kwargs)
         return super(BadgeInstanceList, self).post(request, **kwargs)
 
 
@@ -468,6 +481,8 @@ class IssuerBadgeInstanceList(UncachedPaginatedViewMixin, VersionedObjectMixin,
     v2_serializer_class = BadgeInstanceSerializerV2
     create_event = badgrlog.BadgeInstanceCreatedEvent
     valid_scopes = ["rw:issuer", "rw:issuer:*"]
+    cache_miss_prefetches = BADGEINSTANCE_LIST_CACHE_MISS_PREFETCHES
+    unpaginated_chunk_size = 500
 
     def get_queryset(self, request=None, **kwargs):
         issuer = self.get_object(request, **kwargs)
@@ -333,22 +333,28 @@ class BadgeInstanceManager(BaseOpenBadgeObjectManager):
         with transaction.atomic():
             new_instance.save()
 
-            if evidence is not None:
+            # insert evidence and extensions in one statement each; saving them one at a time would re-publish
+            # new_instance (and its badgeclass, recipient, collections) once per row
+            if evidence:
                 from issuer.models import BadgeInstanceEvidence
-                for evidence_obj in evidence:
-                    evidence_url = evidence_obj.get('evidence_url')
-                    narrative = evidence_obj.get('narrative')
-                    new_evidence = BadgeInstanceEvidence(badgeinstance=new_instance, evidence_url=evidence_url)
-                    if narrative:
-                        new_evidence.narrative = narrative
-                    new_evidence.save()
-
-            if extensions is not None:
-                for name, ext in list(extensions.items()):
-                    new_instance.badgeinstanceextension_set.create(
+                BadgeInstanceEvidence.objects.bulk_create([
+                    BadgeInstanceEvidence(
+                        badgeinstance=new_instance,
+                        evidence_url=evidence_obj.get('evidence_url'),
+                        narrative=evidence_obj.get('narrative') or None
+                    ) for evidence_obj in evidence])
+
+            if extensions:
+                from issuer.models import BadgeInstanceExtension
+                BadgeInstanceExtension.objects.bulk_create([
+                    BadgeInstanceExtension(
+                        badgeinstance=new_instance,
                         name=name,
                         original_json=json.dumps(ext)
-                    )
+                    ) for name, ext in list(extensions.items())])
+
+            if evidence or extensions:
+                new_instance.publish()
 
         if check_completions:
             award_badges_for_pathway_completion.delay(badgeinstance_pk=new_instance.pk)
@@ -5,6 +5,7 @@ import datetime
 import urllib.request, urllib.parse, urllib.error
 
 import dateutil
+import functools
 import re
 import uuid
 from collections import OrderedDict
@@ -21,7 +22,7 @@ from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.core.urlresolvers import reverse
 from django.db import models, transaction
-from django.db.models import ProtectedError
+from django.db.models import Exists, OuterRef, ProtectedError
 from json import loads as json_loads
 from json import dumps as json_dumps
 from jsonfield import JSONField
@@ -417,6 +418,33 @@ def get_user_or_none(recipient_id, recipient_type):
     return user
 
 
+def get_users_for_email_recipients(recipient_ids):
+    """
+    Map each lowercased email in recipient_ids to the user who has verified it (or None), the same answer
+    get_user_or_none() gives for an email recipient but in one query for a whole batch.
+    """
+    from badgeuser.models import CachedEmailAddress
+    users = {recipient_id.lower(): None for recipient_id in recipient_ids}
+    verified_emails = CachedEmailAddress.objects.filter(
+        verified=True, email__in=set(recipient_ids) | set(users)).select_related('user')
+    for verified_email in verified_emails:
+        users[verified_email.email.lower()] = verified_email.user
+    return users
+
+
+@functools.lru_cache(maxsize=None)
+def get_badgebook_award_model():
+    """
+    Resolve the optional badgebook BadgeObjectiveAward model once per process, None if badgebook isn't installed
+    """
+    if apps.is_installed('badgebook'):
+        try:
+            return apps.get_model('badgebook', 'BadgeObjectiveAward')
+        except LookupError:
+            pass
+    return None
+
+
 class BadgeClass(ResizeUploadedImage,
                  ScrubUploadedSvgImage,
                  BaseAuditedModel,
@@ -469,16 +497,32 @@ class BadgeClass(ResizeUploadedImage,
         if self.created_by:
             self.created_by.publish()
 
+    def get_delete_blockers(self):
+        """
+        Check everything that prevents deleting this badgeclass in a single query
+        """
+        active_assertions = self.badgeinstances.model.objects.filter(badgeclass=OuterRef('pk'), revoked=False).filter(
+            models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=timezone.now()))
+        pathway_elements = self.pathwayelementbadge_set.model.objects.filter(badgeclass=OuterRef('pk'))
+        completion_elements = self.completion_elements.model.objects.filter(completion_badgeclass=OuterRef('pk'))
+
+        return BadgeClass.objects.filter(pk=self.pk).annotate(
+            has_active_assertions=Exists(active_assertions),
+            has_pathway_elements=Exists(pathway_elements),
+            has_completion_elements=Exists(completion_elements),
+        ).values('has_active_assertions', 'has_pathway_elements', 'has_completion_elements').get()
+
     def delete(self, *args, **kwargs):
+        blockers = self.get_delete_blockers()
+
         # if there are some assertions and some have not expired
-        if self.recipient_count() > 0 and self.badgeinstances.filter(revoked=False).filter(
-                models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=timezone.now())).count() > 0:
+        if blockers['has_active_assertions']:
             raise ProtectedError("BadgeClass may only be deleted if all BadgeInstances have been revoked.", self)
 
-        if self.pathway_element_count() > 0:
+        if blockers['has_pathway_elements']:
             raise ProtectedError("BadgeClass may only be deleted if all PathwayElementBadge have been removed.", self)
 
-        if len(self.cached_completion_elements()) > 0:
+        if blockers['has_completion_elements']:
             raise ProtectedError("Badge could not be deleted. It is being used as a pathway completion badge.", self)
 
         issuer = self.issuer
@@ -611,12 +655,13 @@ class BadgeClass(ResizeUploadedImage,
         return [pce for pce in self.completion_elements.all()]
 
     def issue(self, recipient_id=None, evidence=None, narrative=None, notify=False, created_by=None, allow_uppercase=False, badgr_app=None, recipient_type=RECIPIENT_TYPE_EMAIL, **kwargs):
+        if 'user' not in kwargs:
+            kwargs['user'] = get_user_or_none(recipient_id, recipient_type)
         return BadgeInstance.objects.create(
             badgeclass=self, recipient_identifier=recipient_id, recipient_type=recipient_type,
             narrative=narrative, evidence=evidence,
             notify=notify, created_by=created_by, allow_uppercase=allow_uppercase,
             badgr_app=badgr_app,
-            user=get_user_or_none(recipient_id, recipient_type),
             **kwargs
         )
 
@@ -930,21 +975,25 @@ class BadgeInstance(BaseAuditedModel,
 
         self.revoked = True
         self.revocation_reason = revocation_reason
-        self.image.delete()
-        self.save()
+        image_name = self.image.name
+        self.image = None
+        # write only the revocation columns; save() still bumps the version and republishes the cache
+        self.save(update_fields=['revoked', 'revocation_reason', 'image', 'entity_version', 'updated_at'])
+
+        # remove the baked image from storage outside of the request
+        if image_name:
+            from issuer.tasks import delete_assertion_image
+            delete_assertion_image.delay(image_name=image_name)
 
         # remove BadgeObjectiveAwards from badgebook if needed
-        if apps.is_installed('badgebook'):
+        BadgeObjectiveAward = get_badgebook_award_model()
+        if BadgeObjectiveAward is not None:
             try:
-                from badgebook.models import BadgeObjectiveAward, LmsCourseInfo
-                try:
-                    award = BadgeObjectiveAward.cached.get(badge_instance_id=self.id)
-                except BadgeObjectiveAward.DoesNotExist:
-                    pass
-                else:
-                    award.delete()
-            except ImportError:
+                award = BadgeObjectiveAward.cached.get(badge_instance_id=self.id)
+            except BadgeObjectiveAward.DoesNotExist:
                 pass
+            else:
+                award.delete()
 
     def notify_earner(self, badgr_app=None):
         """
@@ -1,3 +1,5 @@
+import functools
+
 import oauth2_provider
 import rest_framework
 from django.conf import settings
@@ -63,6 +65,58 @@ rules.add_perm('issuer.can_issue_badge', can_issue_badgeclass)
 rules.add_perm('issuer.can_edit_badgeclass', can_edit_badgeclass)
 
 
+def cache_object_permission_on_request(has_object_permission):
+    """
+    Memoize a has_object_permission() result on the request. Views call get_object() several times per request
+    (get(), get_queryset(), get_context_data()), and each call re-runs the same permission checks.
+    """
+    @functools.wraps(has_object_permission)
+    def wrapper(self, request, view, obj):
+        pk = getattr(obj, 'pk', None)
+        if pk is None:
+            return has_object_permission(self, request, view, obj)
+
+        perm_cache = getattr(request, '_perm_cache', None)
+        if perm_cache is None:
+            perm_cache = request._perm_cache = {}
+
+        key = (type(self).__name__, type(obj).__name__, pk)
+        if key not in perm_cache:
+            perm_cache[key] = has_object_permission(self, request, view, obj)
+        return perm_cache[key]
+    return wrapper
+
+
+STAFF_ROLES = (IssuerStaff.ROLE_OWNER, IssuerStaff.ROLE_EDITOR, IssuerStaff.ROLE_STAFF)
+EDITOR_ROLES = (IssuerStaff.ROLE_OWNER, IssuerStaff.ROLE_EDITOR)
+OWNER_ROLES = (IssuerStaff.ROLE_OWNER,)
+
+
+def get_request_staff_role(request, issuer):
+    """
+    Return request.user's IssuerStaff role on issuer (or None), reading each issuer's staff list once per request.
+    Checks that fan out over many objects of the same issuer (batch revoke) then skip the repeat cache lookups.
+    """
+    staff_roles = getattr(request, '_staff_roles', None)
+    if staff_roles is None:
+        staff_roles = request._staff_roles = {}
+
+    if issuer.pk not in staff_roles:
+        staff_roles[issuer.pk] = next(
+            (s.role for s in issuer.cached_issuerstaff() if s.user_id == request.user.id), None)
+    return staff_roles[issuer.pk]
+
+
+def request_has_staff_role(request, issuer, roles, perm, obj):
+    """
+    Grant if request.user holds one of roles on issuer, otherwise defer to has_perm(perm, obj) so superusers
+    and any other auth backends are still honored.
+    """
+    if issuer.pk is not None and get_request_staff_role(request, issuer) in roles:
+        return True
+    return request.user.has_perm(perm, obj)
+
+
 class MayIssueBadgeClass(permissions.BasePermission):
     """
     Allows those who have been given permission to issue badges on an Issuer to create
@@ -71,8 +125,10 @@ class MayIssueBadgeClass(permissions.BasePermission):
     model: BadgeClass
     """
 
+    @cache_object_permission_on_request
     def has_object_permission(self, request, view, badgeclass):
-        return request.user.has_perm('issuer.can_issue_badge', badgeclass)
+        return request_has_staff_role(
+            request, badgeclass.cached_issuer, STAFF_ROLES, 'issuer.can_issue_badge', badgeclass)
 
 
 class MayEditBadgeClass(permissions.BasePermission):
@@ -84,11 +140,14 @@ class MayEditBadgeClass(permissions.BasePermission):
     model: BadgeClass
     """
 
+    @cache_object_permission_on_request
     def has_object_permission(self, request, view, badgeclass):
         if request.method in SAFE_METHODS:
-            return request.user.has_perm('issuer.can_issue_badge', badgeclass)
+            return request_has_staff_role(
+                request, badgeclass.cached_issuer, STAFF_ROLES, 'issuer.can_issue_badge', badgeclass)
         else:
-            return request.user.has_perm('issuer.can_edit_badgeclass', badgeclass)
+            return request_has_staff_role(
+                request, badgeclass.cached_issuer, EDITOR_ROLES, 'issuer.can_edit_badgeclass', badgeclass)
 
 
 class IsOwnerOrStaff(permissions.BasePermission):
@@ -98,9 +157,9 @@ class IsOwnerOrStaff(permissions.BasePermission):
     """
     def has_object_permission(self, request, view, issuer):
         if request.method in SAFE_METHODS:
-            return request.user.has_perm('issuer.is_staff', issuer)
+            return request_has_staff_role(request, issuer, STAFF_ROLES, 'issuer.is_staff', issuer)
         else:
-            return request.user.has_perm('issuer.is_owner', issuer)
+            return request_has_staff_role(request, issuer, OWNER_ROLES, 'issuer.is_owner', issuer)
 
 
 class IsEditor(permissions.BasePermission):
@@ -113,9 +172,9 @@ class IsEditor(permissions.BasePermission):
 
     def has_object_permission(self, request, view, issuer):
         if request.method in SAFE_METHODS:
-            return request.user.has_perm('issuer.is_staff', issuer)
+            return request_has_staff_role(request, issuer, STAFF_ROLES, 'issuer.is_staff', issuer)
         else:
-            return request.user.has_perm('issuer.is_editor', issuer)
+            return request_has_staff_role(request, issuer, EDITOR_ROLES, 'issuer.is_editor', issuer)
 
 
 class IsEditorButOwnerForDelete(permissions.BasePermission):
@@ -128,11 +187,11 @@ class IsEditorButOwnerForDelete(permissions.BasePermission):
 
     def has_object_permission(self, request, view, issuer):
         if request.method in SAFE_METHODS:
-            return request.user.has_perm('issuer.is_staff', issuer)
+            return request_has_staff_role(request, issuer, STAFF_ROLES, 'issuer.is_staff', issuer)
         elif request.method == 'DELETE':
-            return request.user.has_perm('issuer.is_owner', issuer)
+            return request_has_staff_role(request, issuer, OWNER_ROLES, 'issuer.is_owner', issuer)
         else:
-            return request.user.has_perm('issuer.is_editor', issuer)
+            return request_has_staff_role(request, issuer, EDITOR_ROLES, 'issuer.is_editor', issuer)
 
 
 class IsStaff(permissions.BasePermission):
@@ -143,7 +202,7 @@ class IsStaff(permissions.BasePermission):
     model: Issuer
     """
     def has_object_permission(self, request, view, issuer):
-        return request.user.has_perm('issuer.is_staff', issuer)
+        return request_has_staff_role(request, issuer, STAFF_ROLES, 'issuer.is_staff', issuer)
 
 
 class ApprovedIssuersOnly(permissions.BasePermission):
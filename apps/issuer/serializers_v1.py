@@ -15,10 +15,11 @@ from badgeuser.serializers_v1 import BadgeUserProfileSerializerV1, BadgeUserIden
 from mainsite.drf_fields import ValidImageField
 from mainsite.models import BadgrApp
 from mainsite.serializers import DateTimeWithUtcZAtEndField, HumanReadableBooleanField, StripTagsCharField, MarkdownCharField, \
-    OriginalJsonSerializerMixin
+    OriginalJsonSerializerMixin, NestedSerializerCacheMixin
 from mainsite.utils import OriginSetting
 from mainsite.validators import ChoicesValidator, BadgeExtensionValidator, PositiveIntegerValidator, TelephoneValidator
-from .models import Issuer, BadgeClass, IssuerStaff, BadgeInstance, RECIPIENT_TYPE_EMAIL, RECIPIENT_TYPE_ID, RECIPIENT_TYPE_URL
+from .models import Issuer, BadgeClass, IssuerStaff, BadgeInstance, RECIPIENT_TYPE_EMAIL, RECIPIENT_TYPE_ID, RECIPIENT_TYPE_URL, \
+    get_users_for_email_recipients
 
 
 class CachedListSerializer(serializers.ListSerializer):
@@ -45,7 +46,7 @@ class IssuerStaffSerializerV1(serializers.Serializer):
         })
 
 
-class IssuerSerializerV1(OriginalJsonSerializerMixin, serializers.Serializer):
+class IssuerSerializerV1(NestedSerializerCacheMixin, OriginalJsonSerializerMixin, serializers.Serializer):
     created_at = DateTimeWithUtcZAtEndField(read_only=True)
     created_by = BadgeUserIdentifierFieldV1()
     name = StripTagsCharField(max_length=1024)
@@ -106,7 +107,8 @@ class IssuerSerializerV1(OriginalJsonSerializerMixin, serializers.Serializer):
         representation['json'] = obj.get_json(obi_version='1_1', use_canonical_id=True)
 
         if self.context.get('embed_badgeclasses', False):
-            representation['badgeclasses'] = BadgeClassSerializerV1(obj.badgeclasses.all(), many=True, context=self.context).data
+            badgeclass_serializer = self.get_nested_serializer(BadgeClassSerializerV1, many=True, context=self.context)
+            representation['badgeclasses'] = badgeclass_serializer.to_representation(obj.badgeclasses.all())
 
         representation['badgeClassCount'] = len(obj.cached_badgeclasses())
         representation['recipientGroupCount'] = len(obj.cached_recipient_groups())
@@ -282,7 +284,17 @@ class EvidenceItemSerializer(serializers.Serializer):
         return attrs
 
 
-class BadgeInstanceSerializerV1(OriginalJsonSerializerMixin, serializers.Serializer):
+class BadgeInstanceListSerializerV1(serializers.ListSerializer):
+    def create(self, validated_data):
+        # look up the users behind all email recipients at once instead of once per issued assertion
+        self.context['recipient_users'] = get_users_for_email_recipients([
+            data['recipient_identifier'] for data in validated_data
+            if data.get('recipient_identifier') and data.get('recipient_type', RECIPIENT_TYPE_EMAIL) == RECIPIENT_TYPE_EMAIL
+        ])
+        return super(BadgeInstanceListSerializerV1, self).create(validated_data)
+
+
+class BadgeInstanceSerializerV1(NestedSerializerCacheMixin, OriginalJsonSerializerMixin, serializers.Serializer):
     created_at = DateTimeWithUtcZAtEndField(read_only=True, default_timezone=pytz.utc)
     created_by = BadgeUserIdentifierFieldV1(read_only=True)
     slug = serializers.CharField(max_length=255, read_only=True, source='entity_id')
@@ -308,6 +320,7 @@ class BadgeInstanceSerializerV1(OriginalJsonSerializerMixin, serializers.Seriali
 
     class Meta:
         apispec_definition = ('Assertion', {})
+        list_serializer_class = BadgeInstanceListSerializerV1
 
     def validate(self, data):
         recipient_type = data.get('recipient_type')
@@ -357,11 +370,13 @@ class BadgeInstanceSerializerV1(OriginalJsonSerializerMixin, serializers.Seriali
         representation = super(BadgeInstanceSerializerV1, self).to_representation(instance)
         representation['json'] = instance.get_json(obi_version="1_1", use_canonical_id=True)
         if self.context.get('include_issuer', False):
-            representation['issuer'] = IssuerSerializerV1(instance.cached_badgeclass.cached_issuer).data
+            representation['issuer'] = self.get_nested_serializer(IssuerSerializerV1).to_representation(
+                instance.cached_badgeclass.cached_issuer)
         else:
             representation['issuer'] = OriginSetting.HTTP+reverse('issuer_json', kwargs={'entity_id': instance.cached_issuer.entity_id})
         if self.context.get('include_badge_class', False):
-            representation['badge_class'] = BadgeClassSerializerV1(instance.cached_badgeclass, context=self.context).data
+            representation['badge_class'] = self.get_nested_serializer(
+                BadgeClassSerializerV1, context=self.context).to_representation(instance.cached_badgeclass)
         else:
             representation['badge_class'] = OriginSetting.HTTP+reverse('badgeclass_json', kwargs={'entity_id': instance.cached_badgeclass.entity_id})
 
@@ -385,18 +400,28 @@ class BadgeInstanceSerializerV1(OriginalJsonSerializerMixin, serializers.Seriali
         submitted_items = validated_data.get('evidence_items')
         if submitted_items:
             evidence_items.extend(submitted_items)
+
+        recipient_id = validated_data.get('recipient_identifier')
+        recipient_type = validated_data.get('recipient_type', RECIPIENT_TYPE_EMAIL)
+        issue_kwargs = {}
+        recipient_users = self.context.get('recipient_users')
+        if recipient_users is not None and recipient_id and recipient_type == RECIPIENT_TYPE_EMAIL and \
+                recipient_id.lower() in recipient_users:
+            issue_kwargs['user'] = recipient_users[recipient_id.lower()]
+
         try:
             return self.context.get('badgeclass').issue(
-                recipient_id=validated_data.get('recipient_identifier'),
+                recipient_id=recipient_id,
                 narrative=validated_data.get('narrative'),
                 evidence=evidence_items,
                 notify=validated_data.get('create_notification'),
                 created_by=self.context.get('request').user,
                 allow_uppercase=validated_data.get('allow_uppercase'),
-                recipient_type=validated_data.get('recipient_type', RECIPIENT_TYPE_EMAIL),
+                recipient_type=recipient_type,
                 badgr_app=BadgrApp.objects.get_current(self.context.get('request')),
                 expires_at=validated_data.get('expires_at', None),
-                extensions=validated_data.get('extension_items', None)
+                extensions=validated_data.get('extension_items', None),
+                **issue_kwargs
             )
         except DjangoValidationError as e:
             raise serializers.ValidationError(e.message)
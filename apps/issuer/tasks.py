@@ -5,6 +5,7 @@ import dateutil
 import requests
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.files.storage import default_storage
 from requests import ConnectionError
 
 import badgrlog
@@ -102,6 +103,22 @@ def rebake_assertion_image(self, assertion_entity_id=None, obi_version=CURRENT_O
     }
 
 
+@app.task(bind=True, queue=background_task_queue_name)
+def delete_assertion_image(self, image_name):
+    if not image_name:
+        return {
+            'success': False,
+            'error': "No image name given"
+        }
+
+    default_storage.delete(image_name)
+
+    return {
+        'success': True,
+        'image_name': image_name
+    }
+
+
 @app.task(bind=True, queue=background_task_queue_name)
 def update_issuedon_all_assertions(self, start=None, end=None):
     start_date = None
@@ -4,6 +4,7 @@
 import datetime
 import dateutil.parser
 import json
+import mock
 from unittest import skip
 from openbadges_bakery import unbake
 import png
@@ -12,13 +13,16 @@ import re
 from urllib.parse import quote_plus
 
 from django.core import mail
+from django.core.cache import cache
+from django.core.files.storage import default_storage
 from django.core.urlresolvers import reverse
 from django.utils import timezone
 from django.test import override_settings
 from oauth2_provider.models import Application
 
 from badgeuser.models import CachedEmailAddress, UserRecipientIdentifier
-from issuer.models import BadgeInstance, IssuerStaff, Issuer
+from issuer.api import BadgeInstanceList, IssuerBadgeInstanceList
+from issuer.models import BadgeInstance, BadgeInstanceEvidence, BadgeInstanceExtension, IssuerStaff, Issuer
 from issuer.utils import parse_original_datetime
 from mainsite.tests import BadgrTestCase, SetupIssuerHelper, SetupOAuth2ApplicationHelper
 from mainsite.utils import OriginSetting
@@ -734,6 +738,63 @@ class AssertionTests(SetupIssuerHelper, BadgrTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 2)
 
+    def test_authenticated_owner_list_assertions_with_evidence(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        test_badgeclass.issue(recipient_id='new.recipient@email.test', evidence=[
+            {'evidence_url': 'http://example.com?evidence=foo.bar'}
+        ])
+
+        response = self.client.get('/v2/badgeclasses/{badge}/assertions?num=10'.format(
+            badge=test_badgeclass.entity_id,
+        ))
+        self.assertEqual(response.status_code, 200)
+        result = response.data.get('result')
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['evidence'][0]['url'], 'http://example.com?evidence=foo.bar')
+
+    def test_badgeclass_assertion_list_fetches_badgeclass_once(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        test_badgeclass.issue(recipient_id='new.recipient@email.test')
+        url = '/v2/badgeclasses/{badge}/assertions'.format(badge=test_badgeclass.entity_id)
+
+        with mock.patch.object(BadgeInstanceList, 'get_object', autospec=True,
+                               side_effect=BadgeInstanceList.get_object) as get_object:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data.get('result')), 1)
+        self.assertEqual(get_object.call_count, 1)
+
+        with mock.patch.object(BadgeInstanceList, 'get_object', autospec=True,
+                               side_effect=BadgeInstanceList.get_object) as get_object:
+            response = self.client.post(url, {
+                "recipient": {"identity": "second.recipient@email.test"},
+                "notify": False,
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(get_object.call_count, 1)
+
+    def _issue_with_evidence_and_extensions(self, badgeclass):
+        return badgeclass.issue(
+            recipient_id='recipient{}@email.test'.format(BadgeInstance.objects.count()),
+            evidence=[{'evidence_url': 'http://example.com?evidence=foo.bar'}],
+            extensions={'extensions:ExampleExtension': {'exampleProperty': 'some value'}})
+
+    def test_badgeclass_assertion_list_query_count_is_constant(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+
+        _, response = self.assert_list_query_count_is_constant(
+            '/v2/badgeclasses/{badge}/assertions?num=10'.format(badge=test_badgeclass.entity_id),
+            lambda: self._issue_with_evidence_and_extensions(test_badgeclass),
+            related_models=[BadgeInstanceEvidence, BadgeInstanceExtension])
+        for assertion in response.data['result']:
+            self.assertEqual(assertion['evidence'][0]['url'], 'http://example.com?evidence=foo.bar')
+
     def test_issuer_instance_list_assertions(self):
         test_user = self.setup_user(authenticate=True)
         test_issuer = self.setup_issuer(owner=test_user)
@@ -747,6 +808,57 @@ class AssertionTests(SetupIssuerHelper, BadgrTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 2)
 
+    def test_issuer_instance_list_assertions_in_chunks(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        test_badgeclass.issue(recipient_id='first.recipient@email.test')
+        test_badgeclass.issue(recipient_id='second.recipient@email.test')
+        test_badgeclass.issue(recipient_id='third.recipient@email.test')
+
+        with mock.patch.object(IssuerBadgeInstanceList, 'unpaginated_chunk_size', 2):
+            response = self.client.get('/v2/issuers/{issuer}/assertions'.format(
+                issuer=test_issuer.entity_id,
+            ))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['result']), 3)
+
+    def test_issuer_instance_list_assertions_with_extensions(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        extensions = {'extensions:ExampleExtension': {'exampleProperty': 'some value'}}
+        test_badgeclass.issue(recipient_id='new.recipient@email.test', extensions=extensions)
+
+        response = self.client.get('/v2/issuers/{issuer}/assertions?num=10'.format(
+            issuer=test_issuer.entity_id,
+        ))
+        self.assertEqual(response.status_code, 200)
+        result = response.data.get('result')
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['extensions'], extensions)
+
+    def test_issuer_instance_list_query_count(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        url = '/v2/issuers/{issuer}/assertions'.format(issuer=test_issuer.entity_id)
+
+        cold_query_count, _ = self.assert_list_query_count_is_constant(
+            url,
+            lambda: self._issue_with_evidence_and_extensions(test_badgeclass),
+            related_models=[BadgeInstanceEvidence, BadgeInstanceExtension])
+
+        # each full chunk costs one select plus one prefetch query each for evidence and extensions; the
+        # trailing empty chunk is a select alone. Two chunks of two and an empty one: 3 selects, 4 prefetches
+        # in place of the single chunk's 1 select and 2 prefetches.
+        cache.clear()
+        with mock.patch.object(IssuerBadgeInstanceList, 'unpaginated_chunk_size', 2):
+            with self.assertNumQueries(cold_query_count + 4):
+                response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['result']), 4)
+
     def test_issuer_instance_list_assertions_with_expired(self):
         test_user = self.setup_user(authenticate=True)
         test_issuer = self.setup_issuer(owner=test_user)
@@ -862,6 +974,37 @@ class AssertionTests(SetupIssuerHelper, BadgrTestCase):
             revoked=True
         ), assertion_obo)
 
+    def test_revoke_assertion_removes_baked_image(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        test_assertion = test_badgeclass.issue(recipient_id='new.recipient@email.test')
+        image_name = test_assertion.image.name
+        self.assertTrue(default_storage.exists(image_name))
+
+        test_assertion.revoke('Issued in error')
+
+        self.assertFalse(default_storage.exists(image_name))
+        self.assertFalse(BadgeInstance.objects.get(pk=test_assertion.pk).image)
+
+    def test_issue_assertion_with_evidence_and_extensions(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        evidence = [
+            {'evidence_url': 'http://example.com/evidence/1', 'narrative': 'First piece of evidence'},
+            {'evidence_url': 'http://example.com/evidence/2', 'narrative': ''},
+        ]
+        extensions = {'extensions:ExampleExtension': {'exampleProperty': 'some value'}}
+        test_assertion = test_badgeclass.issue(
+            recipient_id='new.recipient@email.test', evidence=evidence, extensions=extensions)
+
+        cached_assertion = BadgeInstance.cached.get(entity_id=test_assertion.entity_id)
+        self.assertEqual(
+            sorted((e.evidence_url, e.narrative) for e in cached_assertion.evidence_items),
+            [('http://example.com/evidence/1', 'First piece of evidence'), ('http://example.com/evidence/2', None)])
+        self.assertEqual(cached_assertion.extension_items, extensions)
+
     def test_can_revoke_assertion_bulk(self):
         test_user = self.setup_user(authenticate=True)
         test_issuer = self.setup_issuer(owner=test_user)
@@ -1307,6 +1450,33 @@ class AssertionWithUserTests(SetupIssuerHelper, BadgrTestCase):
         award = BadgeInstance.objects.get(recipient_identifier=my_id.identifier)
         self.assertEqual(award.user, recipient)
 
+    def test_v1_batch_issue_sets_recipient_users(self):
+        recipient = self.setup_user(email='recipient@example.com', authenticate=False)
+        unverified = self.setup_user(email='unverified@example.com', authenticate=False, verified=False)
+        owner = self.setup_user(authenticate=True)
+        issuer = self.setup_issuer(owner=owner)
+        badgeclass = self.setup_badgeclass(issuer=issuer)
+
+        # recipients are resolved to users in one query for the batch, not a get_user_or_none() per assertion
+        with mock.patch('issuer.models.get_user_or_none') as get_user_or_none:
+            response = self.client.post('/v1/issuer/issuers/{issuer}/badges/{badge}/batchAssertions'.format(
+                issuer=issuer.entity_id,
+                badge=badgeclass.entity_id
+            ), {
+                'assertions': [
+                    {'recipient_identifier': 'Recipient@example.com'},
+                    {'recipient_identifier': unverified.email},
+                    {'recipient_identifier': 'nobody@example.com'},
+                ],
+                'create_notification': False
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+        get_user_or_none.assert_not_called()
+
+        self.assertEqual(BadgeInstance.objects.get(recipient_identifier='recipient@example.com').user, recipient)
+        self.assertEqual(BadgeInstance.objects.get(recipient_identifier=unverified.email).user, None)
+        self.assertEqual(BadgeInstance.objects.get(recipient_identifier='nobody@example.com').user, None)
+
 
     def test_verification_change_disowns_badge(self):
         recipient = self.setup_user(email='recipient@example.com', authenticate=False)
@@ -3,13 +3,17 @@
 
 import base64
 import json
+import mock
 from urllib.parse import quote_plus
 
 from django.core.files.images import get_image_dimensions
 from django.core.urlresolvers import reverse
+from django.test import RequestFactory
 from django.utils import timezone
 
-from issuer.models import BadgeClass, IssuerStaff
+from issuer.api import IssuerBadgeClassList
+from issuer.models import BadgeClass, BadgeClassAlignment, BadgeClassExtension, BadgeClassTag, IssuerStaff
+from issuer.permissions import MayEditBadgeClass, MayIssueBadgeClass
 from mainsite.tests import BadgrTestCase, SetupIssuerHelper
 from mainsite.utils import OriginSetting
 
@@ -197,6 +201,85 @@ class BadgeClassTests(SetupIssuerHelper, BadgrTestCase):
         self.assertEqual(len(test_badgeclass2), NUM_BADGE_CLASSES)
         self.assertEqual(len(response.data.get('result')), PAGINATE)
 
+    def test_badgeclass_permission_checks_cached_per_request(self):
+        test_user = self.setup_user()
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        other_user = self.setup_user()
+        permission = MayIssueBadgeClass()
+
+        # other_user is not on staff, so the check falls through to has_perm()
+        request = RequestFactory().get('/')
+        request.user = other_user
+        with mock.patch.object(other_user, 'has_perm', return_value=True) as has_perm:
+            self.assertTrue(permission.has_object_permission(request, None, test_badgeclass))
+            self.assertTrue(permission.has_object_permission(request, None, test_badgeclass))
+        self.assertEqual(has_perm.call_count, 1)
+
+        # a new request checks again
+        request = RequestFactory().get('/')
+        request.user = other_user
+        with mock.patch.object(other_user, 'has_perm', return_value=False) as has_perm:
+            self.assertFalse(permission.has_object_permission(request, None, test_badgeclass))
+        self.assertEqual(has_perm.call_count, 1)
+
+    def test_badgeclass_permission_checks_load_issuer_staff_once_per_request(self):
+        test_user = self.setup_user()
+        test_issuer = self.setup_issuer(owner=test_user)
+        badgeclasses = [self.setup_badgeclass(issuer=test_issuer) for _ in range(3)]
+        staff = list(test_issuer.cached_issuerstaff())
+        permission = MayEditBadgeClass()
+
+        request = RequestFactory().post('/')
+        request.user = test_user
+        with mock.patch('issuer.models.Issuer.cached_issuerstaff', return_value=staff) as cached_issuerstaff:
+            for badgeclass in badgeclasses:
+                self.assertTrue(permission.has_object_permission(request, None, badgeclass))
+        self.assertEqual(cached_issuerstaff.call_count, 1)
+
+    def test_issuer_badgeclass_list_fetches_issuer_once(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        self.setup_badgeclass(issuer=test_issuer)
+
+        with mock.patch.object(IssuerBadgeClassList, 'get_object', autospec=True,
+                               side_effect=IssuerBadgeClassList.get_object) as get_object:
+            response = self.client.get('/v2/issuers/{issuer}/badgeclasses'.format(issuer=test_issuer.entity_id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data.get('result')), 1)
+        self.assertEqual(get_object.call_count, 1)
+
+    def _add_badgeclass_with_tags_alignments_and_extensions(self, issuer):
+        badgeclass = self.setup_badgeclass(issuer=issuer)
+        badgeclass.tag_items = ["first", "second"]
+        badgeclass.alignment_items = [{'target_name': 'alignment', 'target_url': 'http://example.com/alignment'}]
+        badgeclass.extension_items = {'extensions:ExampleExtension': {'exampleProperty': 'some value'}}
+        return badgeclass
+
+    def test_v2_issuer_badgeclasses_paginated_query_count_is_constant(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+
+        _, response = self.assert_list_query_count_is_constant(
+            '/v2/issuers/{issuer}/badgeclasses?num=10'.format(issuer=test_issuer.entity_id),
+            lambda: self._add_badgeclass_with_tags_alignments_and_extensions(test_issuer),
+            related_models=[BadgeClassTag, BadgeClassAlignment, BadgeClassExtension])
+        for badgeclass in response.data['result']:
+            self.assertEqual(sorted(badgeclass['tags']), ["first", "second"])
+            self.assertEqual(len(badgeclass['alignments']), 1)
+            self.assertEqual(badgeclass['extensions'], {'extensions:ExampleExtension': {'exampleProperty': 'some value'}})
+
+    def test_v2_issuer_badgeclasses_paginated_includes_tags(self):
+        test_user = self.setup_user(authenticate=True)
+        test_issuer = self.setup_issuer(owner=test_user)
+        test_badgeclass = self.setup_badgeclass(issuer=test_issuer)
+        test_badgeclass.tag_items = ["first", "second"]
+
+        response = self.client.get('/v2/issuers/{issuer}/badgeclasses?num=10'.format(issuer=test_issuer.entity_id))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data.get('result')), 1)
+        self.assertEqual(sorted(response.data.get('result')[0].get('tags')), ["first", "second"])
+
 
     def test_badgeclass_with_expires_in_days_v1(self):
         test_user = self.setup_user(authenticate=True)
@@ -1,7 +1,6 @@
 import base64
 import binascii
 import mimetypes
-import urllib.parse
 import uuid
 
 from django.core.exceptions import ValidationError
@@ -41,6 +40,7 @@ class Base64FileField(FileField):
 
 class ValidImageField(Base64FileField):
     default_validators = [ValidImageValidator()]
+    _SKIPPED_SCHEMES = ('http:', 'https:')
 
     def __init__(self, skip_http=True, allow_empty_file=False, use_url=True, allow_null=True, **kwargs):
         self.skip_http = skip_http
@@ -52,7 +52,7 @@ class ValidImageField(Base64FileField):
     def to_internal_value(self, data):
         # Skip http/https urls to avoid overwriting valid data when, for example, a client GETs and subsequently PUTs an
         # entity containing an image URL.
-        if self.skip_http and not isinstance(data, UploadedFile) and urllib.parse.urlparse(data).scheme in ('http', 'https'):
+        if self.skip_http and isinstance(data, str) and data[:6].lower().startswith(self._SKIPPED_SCHEMES):
             raise SkipField()
 
         return super(ValidImageField, self).to_internal_value(data)
@@ -185,6 +185,28 @@ class OriginalJsonSerializerMixin(serializers.Serializer):
         return representation
 
 
+class NestedSerializerCacheMixin(object):
+    """
+    Reuse serializers that are built inside to_representation() so their declared fields
+    are deep-copied once per parent serializer instead of once per rendered object.
+    A serializer is only reused for a call with the same class, the same kwargs and the same context object.
+    """
+    def get_nested_serializer(self, serializer_class, **kwargs):
+        context = kwargs.get('context')
+        try:
+            key = (serializer_class, id(context), frozenset((k, v) for k, v in kwargs.items() if k != 'context'))
+            hash(key)
+        except TypeError:
+            # unhashable kwargs (e.g. validators=[...]), don't cache
+            return serializer_class(**kwargs)
+
+        cache = self.__dict__.setdefault('_nested_serializer_cache', {})
+        cached = cache.get(key)
+        if cached is None or cached[0] is not context:
+            cached = cache[key] = (context, serializer_class(**kwargs))
+        return cached[1]
+
+
 class CursorPaginatedListSerializer(serializers.ListSerializer):
     def __init__(self, queryset, request, ordering='updated_at', *args, **kwargs):
         self.paginator = BadgrCursorPagination(ordering=ordering)
@@ -5,8 +5,23 @@ from cryptography.fernet import Fernet
 
 from .settings import *
 
-# disable logging for tests
-LOGGING = {}
+# disable logging output for tests, but keep Badgr.Events enabled at INFO so event payloads are still built
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'null': {
+            'class': 'logging.NullHandler',
+        },
+    },
+    'loggers': {
+        'Badgr.Events': {
+            'handlers': ['null'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
 
 DATABASES = {
     'default': {
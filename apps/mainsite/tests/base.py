@@ -8,7 +8,9 @@ import time
 
 from django.core.cache import cache
 from django.core.cache.backends.filebased import FileBasedCache
+from django.db import connection
 from django.test import override_settings, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from oauth2_provider.models import Application
 from rest_framework.test import APITransactionTestCase
@@ -173,6 +175,35 @@ class SetupIssuerHelper(object):
         )
         return badgeclass
 
+    def assert_list_query_count_is_constant(self, url, add_object, related_models):
+        """
+        GET url with a cold cache after one add_object() call, then again after three more, and assert both requests
+        run the same number of queries. A follow-up request with a warm cache must not query related_models at all.
+        Returns the cold-cache query count and the cold-cache response for all four objects.
+        """
+        add_object()
+        cache.clear()
+        with CaptureQueriesContext(connection) as one_object:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        cold_query_count = len(one_object.captured_queries)
+
+        for _ in range(3):
+            add_object()
+        cache.clear()
+        with self.assertNumQueries(cold_query_count):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['result']), 4)
+        cold_response = response
+
+        related_tables = [model._meta.db_table for model in related_models]
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([q['sql'] for q in warm.captured_queries if any(t in q['sql'] for t in related_tables)], [])
+        return cold_query_count, cold_response
+
     def setup_badgeclasses(self, how_many=3, **kwargs):
         for i in range(0, how_many):
             yield self.setup_badgeclass(**kwargs)
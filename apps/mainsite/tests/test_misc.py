@@ -22,11 +22,12 @@ from django.utils import timezone
 from rest_framework import serializers
 from oauth2_provider.models import AccessToken, Application
 
+import badgrlog
 from badgeuser.models import BadgeUser, CachedEmailAddress
 from issuer.models import BadgeClass, Issuer, BadgeInstance
 from mainsite.models import BadgrApp, AccessTokenProxy, AccessTokenScope
 from mainsite import TOP_DIR, blacklist
-from mainsite.serializers import DateTimeWithUtcZAtEndField
+from mainsite.serializers import DateTimeWithUtcZAtEndField, NestedSerializerCacheMixin
 from mainsite.tests import SetupIssuerHelper
 from mainsite.tests.base import BadgrTestCase
 from mainsite.utils import fetch_remote_file_to_storage
@@ -56,6 +57,53 @@ class TestDateSerialization(BadgrTestCase):
         self.assertEqual(ny_serializer.data['the_date'], '2019-12-06T17:00:00Z')
 
 
+class TestNestedSerializerCache(BadgrTestCase):
+    class ChildSerializer(serializers.Serializer):
+        name = serializers.CharField()
+
+    class ParentSerializer(NestedSerializerCacheMixin, serializers.Serializer):
+        def to_representation(self, instance):
+            child = self.get_nested_serializer(TestNestedSerializerCache.ChildSerializer, context=self.context)
+            return {'child': child.to_representation(instance)}
+
+    def test_nested_serializer_reused_across_items(self):
+        items = [{'name': 'first'}, {'name': 'second'}]
+        serializer = self.ParentSerializer(items, many=True)
+        self.assertEqual(serializer.data, [{'child': {'name': 'first'}}, {'child': {'name': 'second'}}])
+
+        parent = serializer.child
+        first = parent.get_nested_serializer(self.ChildSerializer, context=parent.context)
+        self.assertIs(parent.get_nested_serializer(self.ChildSerializer, context=parent.context), first)
+        self.assertIsNot(parent.get_nested_serializer(self.ChildSerializer, context=parent.context, many=True), first)
+
+    def test_nested_serializer_not_reused_across_kwargs(self):
+        parent = self.ParentSerializer()
+        context = {'request': None}
+        with_context = parent.get_nested_serializer(self.ChildSerializer, context=context)
+        self.assertIs(with_context.context, context)
+
+        without_context = parent.get_nested_serializer(self.ChildSerializer)
+        self.assertIsNot(without_context, with_context)
+        self.assertIsNot(parent.get_nested_serializer(self.ChildSerializer, context={'request': None}), with_context)
+        self.assertIsNot(parent.get_nested_serializer(self.ChildSerializer, context=context, read_only=True), with_context)
+        self.assertIs(parent.get_nested_serializer(self.ChildSerializer, context=context), with_context)
+
+
+class TestBadgrLogger(BadgrTestCase):
+    def test_event_not_built_when_logger_disabled(self):
+        logger = badgrlog.BadgrLogger()
+        event = mock.Mock(spec=badgrlog.BadgeInstanceCreatedEvent)
+        event.compacted.return_value = {}
+
+        with mock.patch.object(logger.logger, 'isEnabledFor', return_value=False):
+            logger.event(event)
+        self.assertEqual(event.compacted.call_count, 0)
+
+        with mock.patch.object(logger.logger, 'isEnabledFor', return_value=True):
+            logger.event(event)
+        self.assertEqual(event.compacted.call_count, 1)
+
+
 class TestTokenDenorm(BadgrTestCase, SetupIssuerHelper):
     def test_scopes_created(self):
         self.setup_user(email="foo@bar.com", authenticate=True, token_scope="rw:backpack r:profile")